@@ -1,5 +1,7 @@
+import os
+import sys
+
 try:
-    import os
     # Try to use real Google ADK by default, fall back to mock for testing
     if os.getenv('USE_MOCK_ADK', 'false').lower() == 'true':  # Changed default to 'false'
         raise ImportError("Mock ADK forced for testing")
@@ -14,8 +16,6 @@ try:
 except ImportError:
     print("⚠️ Google ADK not available, using mock implementation")
     # Import mock implementation
-    import sys
-    import os
     sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__)))))
     from mock_adk import (
         ParallelAgent, SequentialAgent, LlmAgent, Runner,
@@ -41,13 +41,15 @@ except ImportError:
     })
 
 import chromadb
-from pyparsing import Any
+from chromadb.errors import NotFoundError
+from chromadb.utils.embedding_functions import ONNXMiniLM_L6_V2
 import json
 import asyncio
 from app.services.resume_service import get_resume_pydantic
 from app.tools.get_url_contents import get_url_contents
-from app.schemas.ResumeSchemas import EducationAgentOutPutSchema, ExperienceAgentOutPutSchema, SkillsAgentOutPutSchema, ProjectsAgentOutPutSchema, ContactInfoAgentOutPutSchema, SummaryAgentOutPutSchema
+from app.schemas.ResumeSchemas import ResumeResponse, EducationAgentOutPutSchema, ExperienceAgentOutPutSchema, SkillsAgentOutPutSchema, ProjectsAgentOutPutSchema, ContactInfoAgentOutPutSchema, SummaryAgentOutPutSchema
 from app.agents.resume.strategic.schema_assembler import create_resume_from_fragments
+from app.core.cache import LRUCache
 import uuid
 
 
@@ -142,6 +144,85 @@ search_agent = LlmAgent(
 search_agent_tool = agent_tool.AgentTool(agent=search_agent)
 
 
+# Chroma inserts are fastest in batches of a few hundred; larger adds are split.
+CHROMA_ADD_BATCH_SIZE = 250
+
+# EphemeralClient instances in one process share a single in-memory system, so
+# one module-level client is created and per-run collection names keep
+# concurrent requests apart.
+CHROMA_CLIENT = chromadb.EphemeralClient()
+
+# Chroma's DefaultEmbeddingFunction builds a new ONNXMiniLM_L6_V2 (reloading the
+# ONNX session) on every call; one shared instance keeps the model loaded.
+EMBEDDING_FUNCTION = ONNXMiniLM_L6_V2()
+
+# Agents re-issue the same search terms across tool calls and requests.
+_query_embedding_cache = LRUCache(maxsize=512)
+
+
+def embed_queries(queries: list[str]) -> list:
+    """Embed query strings, reusing cached embeddings and batching the misses."""
+    cached = [_query_embedding_cache.get(q) for q in queries]
+    misses = list(dict.fromkeys(q for q, e in zip(queries, cached) if e is None))
+    if not misses:
+        return cached
+    fresh = dict(zip(misses, EMBEDDING_FUNCTION(misses)))
+    for q, e in fresh.items():
+        _query_embedding_cache.set(q, e)
+    return [e if e is not None else fresh[q] for q, e in zip(queries, cached)]
+
+
+def add_in_batches(collection, documents: list[str], metadatas: list[dict], ids: list[str]) -> None:
+    """Add documents to a Chroma collection in CHROMA_ADD_BATCH_SIZE slices."""
+    for start in range(0, len(documents), CHROMA_ADD_BATCH_SIZE):
+        end = start + CHROMA_ADD_BATCH_SIZE
+        collection.add(documents=documents[start:end], metadatas=metadatas[start:end], ids=ids[start:end])
+
+
+def dedupe_chunks(chunks: list[str]) -> list[str]:
+    """Drop empty and repeated chunks (compared case- and whitespace-insensitively),
+    keeping the first occurrence in order."""
+    unique: dict[str, str] = {}
+    for chunk in chunks:
+        key = " ".join(chunk.split()).lower()
+        if key:
+            unique.setdefault(key, chunk)
+    return list(unique.values())
+
+
+def query_collection(collection, queries: list[str], top_k: int) -> list[dict]:
+    """Embed `queries` and search `collection`; blocking, run it off the event loop.
+
+    Chroma returns one result list per query. Hits are flattened, a document
+    matched by several queries is kept once with its best (lowest) distance,
+    and the result is ordered closest first.
+    """
+    if isinstance(queries, str):
+        queries = [queries]
+    if not queries:
+        return []
+    results = collection.query(query_embeddings=embed_queries(queries), n_results=top_k)
+    best: dict[str, dict] = {}
+    for q_docs, q_metas, q_scores in zip(results.get('documents') or [], results.get('metadatas') or [], results.get('distances') or []):
+        for doc, meta, score in zip(q_docs, q_metas, q_scores):
+            hit = best.get(doc)
+            if hit is None or score < hit["score"]:
+                best[doc] = {"document": doc, "metadata": meta, "score": score}
+    return sorted(best.values(), key=lambda part: part["score"])
+
+
+_CONTACT_LABELS = (
+    ("email", "Email"),
+    ("phone", "Phone"),
+    ("linkedin", "LinkedIn"),
+    ("github", "GitHub"),
+    ("website", "Website"),
+)
+
+# The only resume fields process_resumes_for_chroma reads.
+CHROMA_RESUME_FIELDS = {"summary", "experience", "projects", "skills", "education", "personalInfo"}
+
+
 def process_resumes_for_chroma(resume_json: dict) -> tuple[list[str], list[dict], list[str]]:
     """
     Convert a resume JSON object into documents, metadatas and ids for ChromaDB.
@@ -183,18 +264,20 @@ def process_resumes_for_chroma(resume_json: dict) -> tuple[list[str], list[dict]
         if isinstance(responsibilities, str):
             responsibilities = [r.strip() for r in responsibilities.splitlines() if r.strip()]
 
-        for responsibility in responsibilities:
-            if not responsibility:
-                continue  # Skip empty strings
-            documents.append(responsibility)
-            metadatas.append({
-                "type": "experience",
-                "company": job.get("company") or "Unknown Company",
-                "position": job.get("position") or "Unknown Position",
-                "startDate": job.get("startDate") or "Unknown",
-                "endDate": job.get("endDate") or "Unknown"
-            })
-            ids.append(str(uuid.uuid4()))
+        responsibilities = [r for r in responsibilities if r]  # Skip empty strings
+        if not responsibilities:
+            continue
+        # Every responsibility of a job shares one metadata dict
+        metadata = {
+            "type": "experience",
+            "company": job.get("company") or "Unknown Company",
+            "position": job.get("position") or "Unknown Position",
+            "startDate": job.get("startDate") or "Unknown",
+            "endDate": job.get("endDate") or "Unknown"
+        }
+        documents.extend(responsibilities)
+        metadatas.extend([metadata] * len(responsibilities))
+        ids.extend([uuid.uuid4().hex for _ in responsibilities])
 
     # --- Process Projects ---
     for project in resume_json.get("projects", []):
@@ -208,7 +291,7 @@ def process_resumes_for_chroma(resume_json: dict) -> tuple[list[str], list[dict]
             "type": "project",
             "name": project.get("name") or "Unknown Project",
         })
-        ids.append(project.get("id") or str(uuid.uuid4()))
+        ids.append(project.get("id") or uuid.uuid4().hex)
 
     # --- Process Skills ---
     skill_list = [skill.get("name") for skill in resume_json.get("skills", []) if skill.get("name")]
@@ -239,22 +322,16 @@ def process_resumes_for_chroma(resume_json: dict) -> tuple[list[str], list[dict]
             "startDate": education.get("startDate") or "Unknown",
             "endDate": education.get("endDate") or "Unknown"
         })
-        ids.append(education.get("id") or str(uuid.uuid4()))
+        ids.append(education.get("id") or uuid.uuid4().hex)
 
     # --- Process Contact Information ---
     contact_info = resume_json.get("personalInfo", {})
     if contact_info:
-        contact_parts = []
-        if contact_info.get("email"):
-            contact_parts.append(f"Email: {contact_info['email']}")
-        if contact_info.get("phone"):
-            contact_parts.append(f"Phone: {contact_info['phone']}")
-        if contact_info.get("linkedin"):
-            contact_parts.append(f"LinkedIn: {contact_info['linkedin']}")
-        if contact_info.get("github"):
-            contact_parts.append(f"GitHub: {contact_info['github']}")
-        if contact_info.get("website"):
-            contact_parts.append(f"Website: {contact_info['website']}")
+        contact_parts = [
+            f"{label}: {contact_info[key]}"
+            for key, label in _CONTACT_LABELS
+            if contact_info.get(key)
+        ]
 
         if contact_parts:
             contact_summary = "Contact information: " + ", ".join(contact_parts)
@@ -265,25 +342,52 @@ def process_resumes_for_chroma(resume_json: dict) -> tuple[list[str], list[dict]
     # Return the prepared data for Chroma insertion (caller will insert)
     return documents, metadatas, ids
 
-async def strategic_resume_agent(
+async def strategic_resume_agent_stream(
     resume_id: str,
-    job_description_url: str
+    job_description_url: str,
+    resume: ResumeResponse | None = None,
 ):
-  # Initialize ChromaDB client
-  chroma_client = chromadb.EphemeralClient()
+  """Run the strategic workflow, yielding progress events as they happen.
+
+  Yields {"step": "fragment", "key": ..., "delta": ...} each time an agent
+  fills in a resume section, then a final {"step": "done", "data": ...}
+  carrying the assembled resume.
+  """
+  # Collections live in the shared client, so each run gets its own names and
+  # drops them afterwards, however the run ends.
+  run_id = uuid.uuid4().hex
+  collection_names = (f"resume_{run_id}", f"jd_{run_id}")
+  try:
+    async for event in _run_strategic_workflow(resume_id, job_description_url, resume, *collection_names):
+      yield event
+  finally:
+    for name in collection_names:
+      try:
+        CHROMA_CLIENT.delete_collection(name)
+      except NotFoundError:
+        pass  # the run stopped before creating it
+
 
-  resume_collection = chroma_client.get_or_create_collection(name="resume_parts")
+async def _run_strategic_workflow(
+    resume_id: str,
+    job_description_url: str,
+    resume: ResumeResponse | None,
+    resume_collection_name: str,
+    jd_collection_name: str,
+):
+  resume_collection = CHROMA_CLIENT.get_or_create_collection(name=resume_collection_name, embedding_function=EMBEDDING_FUNCTION)
 
-  # Step 0 - Get resume parts and store them in ChromaDB
-  resume = get_resume_pydantic(resume_id)
+  # Step 0 - Get resume parts and store them in ChromaDB. Callers that already
+  # loaded the resume pass it in to save a second DB round-trip.
+  if resume is None:
+    resume = await asyncio.to_thread(get_resume_pydantic, resume_id)
 
   if not resume:
     raise ValueError(f"Resume not found for id: {resume_id}")
 
-  documents, metadatas, ids = process_resumes_for_chroma(resume.model_dump())
+  documents, metadatas, ids = process_resumes_for_chroma(resume.model_dump(include=CHROMA_RESUME_FIELDS))
   if not documents:
     raise ValueError("No resume data found to process; cancelling the process.")
-  resume_collection.add(documents=documents, metadatas=metadatas, ids=ids)
 
   # Extract education and contact info directly from resume
   education_data = resume.education if hasattr(resume, 'education') and resume.education else []
@@ -309,30 +413,32 @@ async def strategic_resume_agent(
         "website": contact_dict.get("website", "")
       }]
 
-  # Step 1 - Fetch job description chunks and store in a temporary collection
-  job_description_chunks = await get_url_contents(job_description_url)
-  jd_collection = chroma_client.get_or_create_collection(name=f"jd_{str(uuid.uuid4())[:8]}")
-  jd_collection.add(
-    documents=job_description_chunks,
-    metadatas=[{"source": job_description_url}] * len(job_description_chunks),
-    ids=[str(uuid.uuid4()) for _ in job_description_chunks],
+  # Step 1 - Fetch job description chunks and store in a temporary collection.
+  # The resume ingest (embedding on a worker thread) and the JD fetch are
+  # independent, so they overlap instead of running back to back.
+  _, job_description_chunks = await asyncio.gather(
+    asyncio.to_thread(resume_collection.add, documents=documents, metadatas=metadatas, ids=ids),
+    get_url_contents(job_description_url),
+  )
+  # Page boilerplate repeats across chunks; indexing it again only slows the
+  # insert and crowds real requirements out of the top-k.
+  job_description_chunks = dedupe_chunks(job_description_chunks)
+  jd_collection = CHROMA_CLIENT.get_or_create_collection(name=jd_collection_name, embedding_function=EMBEDDING_FUNCTION)
+  await asyncio.to_thread(
+    add_in_batches,
+    jd_collection,
+    job_description_chunks,
+    [{"source": job_description_url}] * len(job_description_chunks),
+    [uuid.uuid4().hex for _ in job_description_chunks],
   )
 
-  def resume_query_tool(queries: list[str], top_k: int = 4) -> list[dict]:
+  async def resume_query_tool(queries: list[str], top_k: int = 4) -> list[dict]:
     """Query resume collection for relevant information based on search terms."""
-    resume_parts = []
-    results = resume_collection.query(query_texts=queries, n_results=top_k)
-    for doc, meta, score in zip(results.get('documents', []), results.get('metadatas', []), results.get('distances', [])):
-      resume_parts.append({"document": doc, "metadata": meta, "score": score})
-    return resume_parts
+    return await asyncio.to_thread(query_collection, resume_collection, queries, top_k)
 
-  def job_description_query_tool(queries: list[str], top_k: int = 10) -> list[dict]:
+  async def job_description_query_tool(queries: list[str], top_k: int = 10) -> list[dict]:
     """Query job description collection for relevant information based on search terms."""
-    jd_parts = []
-    results = jd_collection.query(query_texts=queries, n_results=top_k)
-    for doc, meta, score in zip(results.get('documents', []), results.get('metadatas', []), results.get('distances', [])):
-      jd_parts.append({"document": doc, "metadata": meta, "score": score})
-    return jd_parts
+    return await asyncio.to_thread(query_collection, jd_collection, queries, top_k)
 
   # Build the experience-analysis agent with creative analysis focus
   experience_agent = LlmAgent(
@@ -512,6 +618,7 @@ async def strategic_resume_agent(
               if key in fragments:
                 fragments[key] = value
                 print(f"✅ Updated fragment '{key}' with structured data")
+                yield {"step": "fragment", "key": key, "delta": value}
           
         except json.JSONDecodeError as e:
           print(f"❌ JSON parsing failed: {e}")
@@ -526,6 +633,7 @@ async def strategic_resume_agent(
                 if k in fragments:
                   fragments[k] = v
                   print(f"⚠️ Fallback: Updated fragment '{k}' with cleaned data")
+                  yield {"step": "fragment", "key": k, "delta": v}
           except json.JSONDecodeError:
             print(f"❌ Fallback parsing also failed for: {cleaned_text}")
       else:
@@ -548,4 +656,17 @@ async def strategic_resume_agent(
     else:
       print(f"✅ Schema validation passed for {diagnostic.field}")
 
+  yield {"step": "done", "data": final_response}
+
+
+async def strategic_resume_agent(
+    resume_id: str,
+    job_description_url: str,
+    resume: ResumeResponse | None = None,
+):
+  """Run the strategic workflow to completion and return the assembled resume."""
+  final_response = None
+  async for event in strategic_resume_agent_stream(resume_id, job_description_url, resume=resume):
+    if event["step"] == "done":
+      final_response = event["data"]
   return final_response
\ No newline at end of file
@@ -1,22 +1,44 @@
-from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, Form
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, Form, Query, Request, Response
+from fastapi.responses import StreamingResponse
+from sqlalchemy.engine import Connection, Engine
+from starlette.concurrency import run_in_threadpool
 from typing import List, Any, Dict, Optional, Union
 from pydantic import BaseModel, Field
 import json
+import hashlib
+import time
+from app.core.cache import LRUCache
+from app.core.config import get_settings
 from app.crud import crud_resume
 from app.schemas.ResumeSchemas import ResumeResponse, ResumeListResponse, ResumeSingleResponse
-from app.db.session import get_db
-from app.services.resume_normalization import (
-    ensure_list_of_dicts,
-    normalize_skills,
-    normalize_projects,
-    normalize_personal_info,
-)
-from app.agents.resume.strategic.strategic_resume_agent import strategic_resume_agent
+from app.schemas.responses import ORJSONResponse, dumps
+from app.db.session import get_read_conn, get_read_engine
+from app.services.resume_service import get_resume_pydantic, iter_resumes_sync, model_to_normalized_dict, normalize_resume_rows
+from app.agents.resume.strategic.strategic_resume_agent import strategic_resume_agent, strategic_resume_agent_stream
 import asyncio
 
 router = APIRouter()
 
+# Serialized list bodies keyed on (skip, limit, max(updatedAt), TTL bucket).
+# Inserts and updates bump max(updatedAt) and invalidate at once; deletes only
+# show up once the bucket rolls over, so they are at most
+# LIST_CACHE_TTL_SECONDS stale. Capped by total body bytes, since the key is
+# client-controlled and a single body can hold hundreds of resumes.
+LIST_CACHE_TTL_SECONDS = 30
+LIST_CACHE_MAX_BYTES = 32 * 1024 * 1024
+_list_cache = LRUCache(maxsize=256, maxweight=LIST_CACHE_MAX_BYTES)
+
+# Pages larger than this are streamed batch-by-batch instead of being
+# buffered (and cached) as one body.
+STREAM_LIST_THRESHOLD = 500
+
+# Caps concurrent agent workflows so bursts queue here instead of piling onto
+# the LLM provider's rate limits.
+LLM_SEM = asyncio.Semaphore(get_settings().RMCRAFT_LLM_CONCURRENCY)
+
+AGENT_TIMEOUT = get_settings().RMCRAFT_AGENT_TIMEOUT_SECONDS
+DISCONNECT_POLL_SECONDS = 1.0
+
 
 class StrategicResumeResponse(BaseModel):
     status: int
@@ -31,67 +53,139 @@ class StrategicResumeRequest(BaseModel):
     theme_id: Optional[str] = Field(None, description="Optional theme ID for PDF generation")
 
 
-# normalization helpers moved to app.services.resume_normalization
-@router.get("/", response_model=ResumeListResponse)
-def read_resumes(skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
-    resumes = crud_resume.get_resumes(db, skip=skip, limit=limit)
-
-    normalized = []
-    for r in resumes:
-        # r is a SQLAlchemy model with JSON columns; coerce into predictable dict
-        item: Dict[str, Any] = {
-            "id": getattr(r, "id", ""),
-            "userId": getattr(r, "userId", ""),
-            "name": getattr(r, "name", ""),
-            "summary": getattr(r, "summary", "") or "",
-                "personalInfo": normalize_personal_info(getattr(r, "personalInfo", None)),
-                "experience": ensure_list_of_dicts(getattr(r, "experience", None)),
-                "education": ensure_list_of_dicts(getattr(r, "education", None)),
-                "skills": normalize_skills(getattr(r, "skills", None)),
-                "projects": normalize_projects(getattr(r, "projects", None)),
-            "jobDescription": getattr(r, "jobDescription", None),
-            "jobProfileId": getattr(r, "jobProfileId", None),
-            "themeId": getattr(r, "themeId", None),
-            "createdAt": getattr(r, "createdAt", None),
-            "updatedAt": getattr(r, "updatedAt", None),
-        }
-        normalized.append(item)
+def _get_list_conn(limit: int = Query(100, ge=0), engine: Engine = Depends(get_read_engine)):
+    # Streamed pages open their own connection (iter_resumes_sync), so don't
+    # check one out of the pool just to leave it idle.
+    if limit > STREAM_LIST_THRESHOLD:
+        yield None
+    else:
+        with engine.connect() as conn:
+            yield conn
+
+
+@router.get("/", responses={200: {"model": ResumeListResponse}})
+async def read_resumes(request: Request, skip: int = Query(0, ge=0), limit: int = Query(100, ge=0), conn: Optional[Connection] = Depends(_get_list_conn)):
+    if limit > STREAM_LIST_THRESHOLD:
+        return StreamingResponse(_stream_resume_list_body(skip, limit), media_type="application/json")
+
+    version = await run_in_threadpool(crud_resume.get_resumes_version, conn)
+    key = (skip, limit) + version + (_list_cache_bucket(),)
+    cached = _list_cache.get(key)
+    if cached is None:
+        body = await _build_resume_list_body(conn, skip, limit)
+        etag = '"%s"' % hashlib.blake2b(body, digest_size=16).hexdigest()
+        cached = (body, etag)
+        _list_cache.set(key, cached, weight=len(body))
+
+    body, etag = cached
+    if _etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers={"ETag": etag})
+    return Response(content=body, media_type="application/json", headers={"ETag": etag})
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Weak comparison per RFC 9110 If-None-Match: proxies and CDNs commonly
+    turn our strong ETag into W/"..." (e.g. after gzip), and clients may send
+    a list or "*"."""
+    if not if_none_match:
+        return False
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == etag:
+            return True
+    return False
+
+
+def _list_cache_bucket() -> int:
+    return int(time.monotonic() // LIST_CACHE_TTL_SECONDS)
+
+
+async def _build_resume_list_body(conn: Connection, skip: int, limit: int) -> bytes:
+    # The query itself is blocking; run it on the threadpool so the event loop
+    # stays free, then normalize and serialize (orjson) on the loop.
+    resumes = await run_in_threadpool(crud_resume.get_resume_rows, conn, skip=skip, limit=limit)
 
-    return {"status": 200, "message": "Resumes returned successfully", "data": normalized}
+    normalized = normalize_resume_rows(resumes)
 
+    # Rows are already normalized into the ResumeListResponse shape, so skip
+    # FastAPI's jsonable_encoder/response_model pass and let orjson encode.
+    return dumps({"status": 200, "message": "Resumes returned successfully", "data": normalized})
 
-@router.get("/{resume_id}", response_model=ResumeSingleResponse)
-def read_resume(resume_id: str, db: Session = Depends(get_db)):
-    r = crud_resume.get_resume(db, resume_id)
+
+def _stream_resume_list_body(skip: int, limit: int):
+    # Sync generator: Starlette pulls each batch on the threadpool, so the
+    # blocking fetches never run on the event loop. Peak memory is one batch.
+    yield b'{"status":200,"message":"Resumes returned successfully","data":['
+    sep = b""
+    for batch in iter_resumes_sync(skip=skip, limit=limit):
+        yield sep + b",".join(dumps(item) for item in normalize_resume_rows(batch))
+        sep = b","
+    yield b"]}"
+
+
+@router.get("/{resume_id}", responses={200: {"model": ResumeSingleResponse}})
+def read_resume(resume_id: str, conn: Connection = Depends(get_read_conn)):
+    r = crud_resume.get_resume_row(conn, resume_id)
     if not r:
-        return {"status": 404, "message": "Resume not found", "data": None}
-
-    item: Dict[str, Any] = {
-        "id": getattr(r, "id", ""),
-        "userId": getattr(r, "userId", ""),
-        "name": getattr(r, "name", ""),
-        "summary": getattr(r, "summary", "") or "",
-    "personalInfo": normalize_personal_info(getattr(r, "personalInfo", None)),
-    "experience": ensure_list_of_dicts(getattr(r, "experience", None)),
-    "education": ensure_list_of_dicts(getattr(r, "education", None)),
-    "skills": normalize_skills(getattr(r, "skills", None)),
-    "projects": normalize_projects(getattr(r, "projects", None)),
-        "jobDescription": getattr(r, "jobDescription", None),
-        "jobProfileId": getattr(r, "jobProfileId", None),
-        "themeId": getattr(r, "themeId", None),
-        "createdAt": getattr(r, "createdAt", None),
-        "updatedAt": getattr(r, "updatedAt", None),
-    }
-
-    return {"status": 200, "message": "Resume returned successfully", "data": item}
+        return ORJSONResponse({"status": 404, "message": "Resume not found", "data": None})
+
+    item = model_to_normalized_dict(r)
+
+    # The row is already normalized into the ResumeSingleResponse shape.
+    return ORJSONResponse({"status": 200, "message": "Resume returned successfully", "data": item})
+
+
+class ClientDisconnected(Exception):
+    pass
+
+
+async def _wait_for_disconnect(request: Request) -> None:
+    while not await request.is_disconnected():
+        await asyncio.sleep(DISCONNECT_POLL_SECONDS)
+
+
+async def _run_agent(request: Request, coro, timeout: float):
+    """Await `coro`, cancelling it on timeout or when the client goes away.
+
+    Raises asyncio.TimeoutError or ClientDisconnected; the agent task is
+    always cancelled rather than left burning LLM calls in the background.
+    """
+    agent_task = asyncio.ensure_future(coro)
+    watcher = asyncio.ensure_future(_wait_for_disconnect(request))
+    try:
+        done, _ = await asyncio.wait(
+            {agent_task, watcher}, timeout=timeout, return_when=asyncio.FIRST_COMPLETED
+        )
+    finally:
+        for task in (agent_task, watcher):
+            task.cancel()
+    if agent_task in done:
+        return agent_task.result()
+    if watcher in done:
+        raise ClientDisconnected()
+    raise asyncio.TimeoutError()
+
+
+async def _throttled(coro):
+    """Await `coro` once an LLM_SEM slot is free.
+
+    Meant to run inside the caller's timeout, so time spent queued for a slot
+    counts against it.
+    """
+    try:
+        async with LLM_SEM:
+            return await coro
+    finally:
+        # Cancelled while still queued: close the never-started coroutine.
+        coro.close()
 
 
 @router.post("/strategic-analysis", response_model=StrategicResumeResponse)
 async def strategic_resume_analysis(
+    request: Request,
     resume_id: str = Form(...),
     job_description_url: str = Form(...),
     theme_id: Optional[str] = Form(None),
-    db: Session = Depends(get_db)
 ):
     """
     Analyze a resume strategically against a job description using AI agents.
@@ -103,23 +197,30 @@ async def strategic_resume_analysis(
     - Provide strategic recommendations for resume optimization
     """
     try:
-        # Validate that the resume exists
-        resume = crud_resume.get_resume(db, resume_id)
-        if not resume:
+        # Validate that the resume exists. The lookup releases its connection
+        # straight away rather than holding a pooled one for the agent run.
+        resume = await run_in_threadpool(get_resume_pydantic, resume_id)
+        if resume is None:
             raise HTTPException(status_code=404, detail="Resume not found")
         
-        # Call the strategic resume agent with a safe timeout to avoid hanging requests
+        # Call the strategic resume agent with a safe timeout to avoid hanging
+        # requests; waiting for a concurrency slot counts against it too.
         try:
-            result = await asyncio.wait_for(
-                strategic_resume_agent(
+            result = await _run_agent(
+                request,
+                _throttled(strategic_resume_agent(
                     resume_id=resume_id,
-                    job_description_url=job_description_url
-                ),
-                timeout=65.0,
+                    job_description_url=job_description_url,
+                    resume=resume,
+                )),
+                timeout=AGENT_TIMEOUT,
             )
         except asyncio.TimeoutError:
             # Agents didn't produce a final response in time — return a timeout to the client
             raise HTTPException(status_code=504, detail="Strategic analysis timed out; try again or check agent logs")
+        except ClientDisconnected:
+            # Nobody is waiting for the answer; the agent has already been cancelled
+            raise HTTPException(status_code=499, detail="Client closed request")
         
         return {
             "status": 200,
@@ -127,7 +228,103 @@ async def strategic_resume_analysis(
             "data": result
         }
         
+    except HTTPException:
+        raise
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
+
+
+def _sse(event: str, data: Any) -> bytes:
+    return b"event: " + event.encode() + b"\ndata: " + dumps(data) + b"\n\n"
+
+
+_STREAM_END = object()
+
+
+async def _pump_agent_events(queue: asyncio.Queue, **agent_kwargs) -> None:
+    """Run the agent stream in its own task, feeding events (then _STREAM_END,
+    or the exception it failed with) into `queue`."""
+    try:
+        async with LLM_SEM:
+            async for event in strategic_resume_agent_stream(**agent_kwargs):
+                queue.put_nowait(event)
+    except Exception as e:
+        queue.put_nowait(e)
+    else:
+        queue.put_nowait(_STREAM_END)
+
+
+def _stream_error(e: Exception) -> Dict[str, Any]:
+    if isinstance(e, TimeoutError):
+        return {"status": 504, "detail": "Strategic analysis timed out; try again or check agent logs"}
+    if isinstance(e, ValueError):
+        return {"status": 400, "detail": str(e)}
+    return {"status": 500, "detail": f"Internal server error: {str(e)}"}
+
+
+async def _strategic_event_stream(resume_id: str, job_description_url: str, resume: ResumeResponse):
+    # The agent (and its LLM_SEM wait) runs in a separate task and the
+    # deadline only bounds our waits on its queue. Nothing is yielded inside a
+    # timeout scope, so a slow client paused at a yield can't have the
+    # deadline's cancel land in Starlette's send().
+    queue: asyncio.Queue = asyncio.Queue()
+    pump = asyncio.create_task(_pump_agent_events(
+        queue,
+        resume_id=resume_id,
+        job_description_url=job_description_url,
+        resume=resume,
+    ))
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + AGENT_TIMEOUT
+    error = None
+    try:
+        while True:
+            if queue.empty():
+                try:
+                    item = await asyncio.wait_for(queue.get(), max(deadline - loop.time(), 0))
+                except TimeoutError as e:
+                    error = _stream_error(e)
+                    break
+            else:
+                # Events the agent already produced are delivered even if the
+                # client was too slow to read them before the deadline.
+                item = queue.get_nowait()
+            if item is _STREAM_END:
+                break
+            if isinstance(item, Exception):
+                error = _stream_error(item)
+                break
+            yield _sse(item["step"], item)
+    finally:
+        pump.cancel()
+    if error is not None:
+        yield _sse("error", error)
+
+
+@router.post("/strategic-analysis/stream")
+async def strategic_resume_analysis_stream(
+    resume_id: str = Form(...),
+    job_description_url: str = Form(...),
+    theme_id: Optional[str] = Form(None),
+):
+    """
+    Server-Sent Events variant of /strategic-analysis.
+
+    Emits a `fragment` event as each agent fills in a resume section and a
+    final `done` event with the assembled resume, so clients can render
+    progress instead of waiting on one blocked response. Failures after the
+    stream has started arrive as an `error` event carrying the status code.
+    Starlette cancels the generator, and with it the agent run, if the
+    client disconnects.
+    """
+    resume = await run_in_threadpool(get_resume_pydantic, resume_id)
+    if resume is None:
+        raise HTTPException(status_code=404, detail="Resume not found")
+
+    return StreamingResponse(
+        _strategic_event_stream(resume_id, job_description_url, resume),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache"},
+    )
@@ -0,0 +1,65 @@
+from collections import OrderedDict
+from threading import Lock
+from typing import Any, Hashable, Optional
+
+
+class LRUCache:
+    """Small thread-safe in-process LRU cache.
+
+    Used for hot read paths whose results can be keyed on something cheap to
+    compute (e.g. the resume table version), so stale entries simply stop
+    being looked up and age out.
+
+    If `maxweight` is set, entries also carry a caller-supplied weight (e.g.
+    a body's size in bytes) and the least recently used ones are evicted
+    until the total fits; a single entry heavier than `maxweight` is not
+    stored at all.
+    """
+
+    def __init__(self, maxsize: int = 128, maxweight: Optional[int] = None):
+        self.maxsize = maxsize
+        self.maxweight = maxweight
+        self._data: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._weights: "dict[Hashable, int]" = {}
+        self._weight = 0
+        self._lock = Lock()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        with self._lock:
+            try:
+                value = self._data.pop(key)
+            except KeyError:
+                return None
+            self._data[key] = value
+            return value
+
+    def set(self, key: Hashable, value: Any, weight: int = 0) -> None:
+        with self._lock:
+            self._discard(key)
+            if self.maxweight is not None and weight > self.maxweight:
+                return
+            self._data[key] = value
+            self._weights[key] = weight
+            self._weight += weight
+            while len(self._data) > self.maxsize or (
+                self.maxweight is not None and self._weight > self.maxweight
+            ):
+                self._discard(next(iter(self._data)))
+
+    def _discard(self, key: Hashable) -> None:
+        if key in self._data:
+            del self._data[key]
+            self._weight -= self._weights.pop(key)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self._weights.clear()
+            self._weight = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    @property
+    def weight(self) -> int:
+        return self._weight
@@ -1,21 +1,24 @@
-try:
-    from pydantic_settings import BaseSettings, SettingsConfigDict
-except ImportError:
-    # Fallback for testing/mock environments
-    from .config_mock import settings
-    raise ImportError("Using mock settings - pydantic_settings not available")
+from functools import lru_cache
 
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from dotenv import load_dotenv
 
-# Load environment variables from .env file
-load_dotenv()
 
 class Settings(BaseSettings):
     DATABASE_URL: str
     GOOGLE_API_KEY: str
     GOOGLE_GENAI_USE_VERTEXAI: str = "FALSE"
+    # Max agent workflows running at once per process; extra requests queue.
+    RMCRAFT_LLM_CONCURRENCY: int = 8
+    # Upper bound on one strategic agent run before the request gets a 504.
+    RMCRAFT_AGENT_TIMEOUT_SECONDS: float = 65.0
 
     model_config = SettingsConfigDict(env_file=".env", extra="ignore")
 
-settings = Settings()
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    # Load .env into os.environ once (the Google SDKs read GOOGLE_API_KEY from
+    # there), then build and validate Settings once per process.
+    load_dotenv()
+    return Settings()
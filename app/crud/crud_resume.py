@@ -1,9 +1,67 @@
+from sqlalchemy import Text, cast, func, select
+from sqlalchemy.engine import Connection
 from sqlalchemy.orm import Session
 from app.models.resume import Resume
 
+# List queries fetch jobDescription as its raw JSON text: it is passed through
+# to the response untouched, so parsing it only to re-serialize is wasted work.
+_LIST_COLUMNS = [
+    cast(c, Text).label(c.key) if c.key == "jobDescription" else c
+    for c in Resume.__table__.c
+]
+
+# Newest first; id breaks ties so offset pagination is stable between pages.
+# Only index-backed if the ("updatedAt" DESC, id) index from app/db/README.md
+# exists; otherwise every page is a full sort.
+_LIST_ORDER = (Resume.updatedAt.desc(), Resume.id)
+
+
 def get_resumes(db: Session, skip: int = 0, limit: int = 100):
-    return db.query(Resume).offset(skip).limit(limit).all()
+    return db.query(Resume).order_by(*_LIST_ORDER).offset(skip).limit(limit).all()
+
+
+def get_resume_rows(conn: Connection, skip: int = 0, limit: int = 100):
+    """Core variant of get_resumes for read-only connections (no ORM/Session)."""
+    return conn.execute(select(*_LIST_COLUMNS).order_by(*_LIST_ORDER).offset(skip).limit(limit)).all()
+
+
+def iter_resumes(conn: Connection, skip: int = 0, limit: int = 100, batch_size: int = 200):
+    """Yield resume rows in batches of `batch_size` without loading the whole page.
+
+    yield_per implies stream_results=True and max_row_buffer=batch_size. On
+    PostgreSQL (psycopg2) that is a named server-side cursor, so only one
+    batch is held client-side; named cursors need a transaction, so `conn`
+    must come from the transactional engine, not the AUTOCOMMIT read_engine.
+    Drivers without server-side cursors (e.g. SQLite) still fetch in batches
+    of `batch_size`.
+    """
+    stmt = select(*_LIST_COLUMNS).order_by(*_LIST_ORDER).offset(skip).limit(limit).execution_options(yield_per=batch_size)
+    yield from conn.execute(stmt).partitions()
+
+
+def get_resumes_version(conn: Connection):
+    """Return (max(updatedAt),) for the resumes table.
+
+    One index lookup if the updatedAt index from app/db/README.md exists, a
+    full scan otherwise. It changes whenever a resume is inserted or updated,
+    so it can be used as a cache key; deleting a row other than the newest
+    does not change it, so callers that cache on it must bound staleness some
+    other way (see read_resumes).
+    """
+    return tuple(conn.execute(select(func.max(Resume.updatedAt))).one())
+
+
+def get_resume_version(conn: Connection, resume_id: str):
+    """Return (updatedAt,) for one resume, or None if it does not exist."""
+    row = conn.execute(select(Resume.updatedAt).where(Resume.id == resume_id)).first()
+    return None if row is None else tuple(row)
 
 
 def get_resume(db: Session, resume_id: str):
     return db.query(Resume).filter(Resume.id == resume_id).first()
+
+
+def get_resume_row(conn: Connection, resume_id: str):
+    # Select table columns rather than the entity so the statement stays pure
+    # Core and skips ORM compile/result processing.
+    return conn.execute(select(*Resume.__table__.c).where(Resume.id == resume_id)).first()
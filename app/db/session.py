@@ -1,10 +1,14 @@
+from fastapi import Depends
 from sqlalchemy import create_engine
+from sqlalchemy.engine import Engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
-from app.core.config import settings
+from app.core.config import get_settings
 
-engine = create_engine(settings.DATABASE_URL)
+engine = create_engine(get_settings().DATABASE_URL)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# Read-only GETs skip the Session/transaction bookkeeping entirely.
+read_engine = engine.execution_options(isolation_level="AUTOCOMMIT")
 Base = declarative_base()
 
 def get_db():
@@ -13,3 +17,14 @@ def get_db():
         yield db
     finally:
         db.close()
+
+
+def get_read_engine() -> Engine:
+    """The engine read routes connect through; override this dependency to
+    point every read route at another database."""
+    return read_engine
+
+
+def get_read_conn(engine: Engine = Depends(get_read_engine)):
+    with engine.connect() as conn:
+        yield conn
@@ -17,4 +17,4 @@ class Resume(Base):
     jobProfileId = Column(String, nullable=True)
     themeId = Column(String, nullable=True)
     createdAt = Column(DateTime)
-    updatedAt = Column(DateTime)
+    updatedAt = Column(DateTime, index=True)
@@ -2,9 +2,7 @@ import pydantic
 from pydantic import BaseModel, Field
 from typing import List, Optional, Any, Literal, Dict, Union
 from datetime import datetime
-import uuid
 from enum import Enum
-from typing import Optional, List
 
 class PersonalInfo(BaseModel):
     id: str
@@ -121,8 +119,9 @@ class ResumeResponse(BaseModel):
     personalInfo: Optional[Union[PersonalInfo, Dict[str, Any]]] = None
     experience: List[Union[Experience, Dict[str, Any]]] = Field(default_factory=list)
     education: List[Union[Education, Dict[str, Any]]] = Field(default_factory=list)
-    # skills in DB appear as: list of Skill-like dicts (sometimes missing id), list of strings, or a dict of categories
-    skills: Union[List[Union[Skill, Dict[str, Any], str]], Dict[str, List[str]]] = Field(default_factory=list)
+    # skills in DB appear as Skill-like dicts (sometimes missing id), strings, or a dict of
+    # categories; resume_normalization.normalize_skills maps them all to a list of dicts
+    skills: List[Dict[str, Any]] = Field(default_factory=list)
     projects: List[Union[Project, Dict[str, Any]]] = Field(default_factory=list)
     jobDescription: Optional[Union[JobDescription, Dict[str, Any]]] = None
     jobProfileId: Optional[str] = None
@@ -130,7 +129,9 @@ class ResumeResponse(BaseModel):
     createdAt: datetime
     updatedAt: datetime
 
-    model_config = pydantic.ConfigDict(from_attributes=True)
+    # instances are cached and shared across requests (resume_service), so
+    # they are immutable once built
+    model_config = pydantic.ConfigDict(from_attributes=True, frozen=True)
 
 
 class ResumeListResponse(BaseModel):
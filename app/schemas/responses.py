@@ -0,0 +1,37 @@
+"""Response classes shared by the API routers.
+
+Endpoints return ORJSONResponse directly (declaring their envelope model via
+`responses={200: {"model": ...}}` for OpenAPI) so FastAPI's response_model
+validation and jsonable_encoder pass never run on the way out.
+"""
+from decimal import Decimal
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+# DB timestamps are stored as naive UTC; emit them with an explicit "Z" so
+# clients don't read them as local time.
+ORJSON_OPTIONS = orjson.OPT_NAIVE_UTC | orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS
+
+
+def _default(obj: Any) -> Any:
+    # Types orjson does not encode natively.
+    if isinstance(obj, BaseModel):
+        return obj.model_dump()
+    if isinstance(obj, Decimal):
+        return str(obj)
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+def dumps(content: Any) -> bytes:
+    """Serialize `content` exactly as ORJSONResponse would."""
+    return orjson.dumps(content, default=_default, option=ORJSON_OPTIONS)
+
+
+class ORJSONResponse(JSONResponse):
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
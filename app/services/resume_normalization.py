@@ -22,21 +22,21 @@ def ensure_list_of_dicts(x: Any) -> list:
 
 
 def normalize_skills(skills: Any) -> list:
-    """Normalize skills to a list of skill-like dicts: {id?, name, level?}."""
+    """Normalize skills to a list of skill-like dicts: {id?, name, level?, category?}."""
     if skills is None:
         return []
     if isinstance(skills, dict):
-        # dict-of-categories: flatten values
+        # dict-of-categories: flatten values, keeping the category on each skill
         out = []
         for cat, vals in skills.items():
             if isinstance(vals, list):
                 for v in vals:
                     if isinstance(v, dict):
-                        out.append(v)
+                        out.append({"category": cat, **v})
                     else:
-                        out.append({"name": v})
+                        out.append({"name": v, "category": cat})
             else:
-                out.append({"name": vals})
+                out.append({"name": vals, "category": cat})
         return out
     if isinstance(skills, list):
         out = []
@@ -79,3 +79,37 @@ def normalize_personal_info(pi: Any) -> dict:
         return pi
     # primitive
     return {"id": "", "firstName": str(pi)}
+
+
+# Batch variants: normalize one column across many rows. Values that are
+# already in canonical shape (the common case) pass straight through; only
+# the odd ones fall back to the per-value normalizers above.
+
+def ensure_list_of_dicts_batch(values: List[Any]) -> list:
+    return [
+        x if type(x) is list and all(type(i) is dict for i in x) else ensure_list_of_dicts(x)
+        for x in values
+    ]
+
+
+def normalize_skills_batch(values: List[Any]) -> list:
+    return [
+        x if type(x) is list and all(type(s) is dict for s in x) else normalize_skills(x)
+        for x in values
+    ]
+
+
+def normalize_projects_batch(values: List[Any]) -> list:
+    return [
+        x
+        if type(x) is list and all(type(p) is dict and ("name" in p or "title" not in p) for p in x)
+        else normalize_projects(x)
+        for x in values
+    ]
+
+
+def normalize_personal_info_batch(values: List[Any]) -> list:
+    return [
+        x if type(x) is dict and x and x.get("id") is not None else normalize_personal_info(x)
+        for x in values
+    ]
@@ -1,15 +1,22 @@
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional
 import asyncio
 
+import orjson
+
 from sqlalchemy.orm import Session
 
+from app.core.cache import LRUCache
 from app.crud import crud_resume
-from app.db.session import SessionLocal
+from app.db.session import SessionLocal, engine, read_engine
 from app.services.resume_normalization import (
     ensure_list_of_dicts,
     normalize_skills,
     normalize_projects,
     normalize_personal_info,
+    ensure_list_of_dicts_batch,
+    normalize_skills_batch,
+    normalize_projects_batch,
+    normalize_personal_info_batch,
 )
 
 # pydantic schemas
@@ -29,6 +36,19 @@ def get_resumes_sync(skip: int = 0, limit: int = 100) -> List[Any]:
         db.close()
 
 
+def iter_resumes_sync(skip: int = 0, limit: int = 100, batch_size: int = 200) -> Iterator[List[Any]]:
+    """Synchronous generator yielding batches of resume rows.
+
+    Owns its connection for the lifetime of the iteration so it can back a
+    streaming response after the request's dependencies have been torn down.
+    Uses the transactional `engine`, not the AUTOCOMMIT `read_engine`:
+    psycopg2 refuses the named server-side cursor iter_resumes asks for
+    outside a transaction.
+    """
+    with engine.connect() as conn:
+        yield from crud_resume.iter_resumes(conn, skip=skip, limit=limit, batch_size=batch_size)
+
+
 def get_resume_sync(resume_id: str) -> Optional[Any]:
     """Synchronous service to retrieve a single resume by id."""
     db: Session = SessionLocal()
@@ -38,47 +58,122 @@ def get_resume_sync(resume_id: str) -> Optional[Any]:
         db.close()
 
 
-def _model_to_normalized_dict(r: Any) -> Dict[str, Any]:
+# Response field order, prebuilt once. dict.copy() of this shell is cheaper
+# than building a fresh 14-key dict per row.
+RESUME_FIELDS = (
+    "id", "userId", "name", "summary", "personalInfo", "experience", "education",
+    "skills", "projects", "jobDescription", "jobProfileId", "themeId", "createdAt", "updatedAt",
+)
+_RESUME_SHELL: Dict[str, Any] = dict.fromkeys(RESUME_FIELDS)
+
+
+def model_to_normalized_dict(r: Any) -> Dict[str, Any]:
     """Convert a SQLAlchemy resume model instance into the normalized
     dict shape used by the API and Pydantic models.
 
-    This centralizes the normalization logic so callers can either get the
-    raw model (get_resume_sync) or a validated Pydantic instance
-    (get_resume_pydantic).
+    This is the single place the row -> dict mapping lives; the resume
+    endpoints, async_get_resume and get_resume_pydantic all go through it.
     """
-    item = {
-        "id": getattr(r, "id", ""),
-        "userId": getattr(r, "userId", ""),
-        "name": getattr(r, "name", ""),
-        "summary": getattr(r, "summary", "") or "",
-        "personalInfo": normalize_personal_info(getattr(r, "personalInfo", None)),
-        "experience": ensure_list_of_dicts(getattr(r, "experience", None)),
-        "education": ensure_list_of_dicts(getattr(r, "education", None)),
-        "skills": normalize_skills(getattr(r, "skills", None)),
-        "projects": normalize_projects(getattr(r, "projects", None)),
-        "jobDescription": getattr(r, "jobDescription", None),
-        "jobProfileId": getattr(r, "jobProfileId", None),
-        "themeId": getattr(r, "themeId", None),
-        "createdAt": getattr(r, "createdAt", None),
-        "updatedAt": getattr(r, "updatedAt", None),
-    }
+    item = _RESUME_SHELL.copy()
+    item["id"] = getattr(r, "id", "")
+    item["userId"] = getattr(r, "userId", "")
+    item["name"] = getattr(r, "name", "")
+    item["summary"] = getattr(r, "summary", "") or ""
+    item["personalInfo"] = normalize_personal_info(getattr(r, "personalInfo", None))
+    item["experience"] = ensure_list_of_dicts(getattr(r, "experience", None))
+    item["education"] = ensure_list_of_dicts(getattr(r, "education", None))
+    item["skills"] = normalize_skills(getattr(r, "skills", None))
+    item["projects"] = normalize_projects(getattr(r, "projects", None))
+    item["jobDescription"] = getattr(r, "jobDescription", None)
+    item["jobProfileId"] = getattr(r, "jobProfileId", None)
+    item["themeId"] = getattr(r, "themeId", None)
+    item["createdAt"] = getattr(r, "createdAt", None)
+    item["updatedAt"] = getattr(r, "updatedAt", None)
 
     return item
 
 
+def normalize_resume_rows(rows: List[Any]) -> List[Dict[str, Any]]:
+    """Batch version of model_to_normalized_dict for list endpoints.
+
+    Normalizes column-at-a-time so each normalizer runs over one shape of
+    data in a tight loop, then zips the columns back into row dicts. A
+    jobDescription fetched as raw JSON text (see crud_resume.get_resume_rows)
+    is wrapped in an orjson.Fragment so it is spliced into the body as-is.
+    """
+    personal_infos = normalize_personal_info_batch([r.personalInfo for r in rows])
+    experiences = ensure_list_of_dicts_batch([r.experience for r in rows])
+    educations = ensure_list_of_dicts_batch([r.education for r in rows])
+    skills = normalize_skills_batch([r.skills for r in rows])
+    projects = normalize_projects_batch([r.projects for r in rows])
+
+    shell_copy = _RESUME_SHELL.copy
+    out = []
+    for r, personal_info, experience, education, skill_list, project_list in zip(
+        rows, personal_infos, experiences, educations, skills, projects
+    ):
+        item = shell_copy()
+        item["id"] = r.id
+        item["userId"] = r.userId
+        item["name"] = r.name
+        item["summary"] = r.summary or ""
+        item["personalInfo"] = personal_info
+        item["experience"] = experience
+        item["education"] = education
+        item["skills"] = skill_list
+        item["projects"] = project_list
+        job_description = r.jobDescription
+        item["jobDescription"] = orjson.Fragment(job_description) if type(job_description) is str else job_description
+        item["jobProfileId"] = r.jobProfileId
+        item["themeId"] = r.themeId
+        item["createdAt"] = r.createdAt
+        item["updatedAt"] = r.updatedAt
+        out.append(item)
+    return out
+
+
+# Unvalidated ResumeResponse models (see resume_to_pydantic) keyed on
+# (id, updatedAt). Any write bumps updatedAt, so a stale entry is never looked
+# up again and simply ages out.
+_resume_cache = LRUCache(maxsize=256)
+
+
 def get_resume_pydantic(resume_id: str) -> Optional[ResumeResponse]:
     """Return a Pydantic `ResumeResponse` for the requested resume id.
 
-    Returns None if the resume is not found. Callers should handle
-    pydantic.ValidationError if the DB contains unexpected shapes.
+    Returns None if the resume is not found. The model is built from the
+    normalized row without validation (see resume_to_pydantic).
+    The lookup uses a short-lived read connection that is returned to the
+    pool before this function returns. Results are cached per
+    (id, updatedAt), so a repeat call costs one primary-key lookup of
+    updatedAt and the returned (frozen) model is shared.
     """
-    r = get_resume_sync(resume_id)
+    with read_engine.connect() as conn:
+        version = crud_resume.get_resume_version(conn, resume_id)
+        if version is None:
+            return None
+        resume = _resume_cache.get((resume_id,) + version)
+        if resume is not None:
+            return resume
+        r = crud_resume.get_resume_row(conn, resume_id)
     if not r:
         return None
 
-    item = _model_to_normalized_dict(r)
-    # Use pydantic v2 model_validate to construct the model from a dict.
-    return ResumeResponse.model_validate(item)
+    resume = resume_to_pydantic(r)
+    _resume_cache.set((resume_id, r.updatedAt), resume)
+    return resume
+
+
+def resume_to_pydantic(r: Any) -> ResumeResponse:
+    """Build a `ResumeResponse` from an already-fetched resume row.
+
+    The row is normalized and the model is built with model_construct,
+    without validation; get_resume_pydantic uses it on a cache miss.
+    """
+    item = model_to_normalized_dict(r)
+    # The dict is already normalized into ResumeResponse's shape, so build the
+    # model without re-running validation (and its Union probing) per field.
+    return ResumeResponse.model_construct(**item)
 
 
 async def async_get_resumes(skip: int = 0, limit: int = 100) -> List[Any]:
@@ -96,23 +191,7 @@ async def async_get_resume(resume_id: str) -> Dict[str, Any]:
         if not r:
             return {"status": 404, "message": "Resume not found", "data": None}
 
-        # coerce the SQLAlchemy model into a dict similarly to the endpoint
-        item = {
-            "id": getattr(r, "id", ""),
-            "userId": getattr(r, "userId", ""),
-            "name": getattr(r, "name", ""),
-            "summary": getattr(r, "summary", "") or "",
-            "personalInfo": normalize_personal_info(getattr(r, "personalInfo", None)),
-            "experience": ensure_list_of_dicts(getattr(r, "experience", None)),
-            "education": ensure_list_of_dicts(getattr(r, "education", None)),
-            "skills": normalize_skills(getattr(r, "skills", None)),
-            "projects": normalize_projects(getattr(r, "projects", None)),
-            "jobDescription": getattr(r, "jobDescription", None),
-            "jobProfileId": getattr(r, "jobProfileId", None),
-            "themeId": getattr(r, "themeId", None),
-            "createdAt": getattr(r, "createdAt", None),
-            "updatedAt": getattr(r, "updatedAt", None),
-        }
+        item = model_to_normalized_dict(r)
 
         return {"status": 200, "message": "Resume returned successfully", "data": item}
 
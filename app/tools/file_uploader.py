@@ -1,11 +1,17 @@
 # In app/tools/file_uploader.py
 import cloudinary
 import cloudinary.uploader
+import io
 import os
 from dotenv import load_dotenv
 
 load_dotenv() # Load environment variables from .env file
 
+# Files above this size go through Cloudinary's chunked upload API, which
+# retries per chunk instead of resending the whole file on a failed request.
+LARGE_UPLOAD_THRESHOLD_BYTES = 20_000_000
+LARGE_UPLOAD_CHUNK_BYTES = 6_000_000
+
 def configure_cloudinary():
     """Configures the Cloudinary client with credentials from .env."""
     cloudinary.config(
@@ -15,16 +21,39 @@ def configure_cloudinary():
         secure=True
     )
 
-def upload_to_cloudinary(file_path: str, public_id: str) -> str | None:
-    """Uploads a file to Cloudinary and returns its secure URL."""
+def upload_to_cloudinary(file: str | bytes, public_id: str) -> str | None:
+    """Uploads a file to Cloudinary and returns its secure URL.
+
+    `file` is anything cloudinary.uploader.upload accepts (a local path, a
+    remote URL or a data URI) or the file's bytes (e.g. from
+    create_pdf_bytes), so generated files need not be written to disk first.
+    Local files and bytes larger than LARGE_UPLOAD_THRESHOLD_BYTES are sent
+    in chunks via `upload_large`.
+    """
     try:
         configure_cloudinary()
-        upload_result = cloudinary.uploader.upload(
-            file_path,
-            public_id=public_id,
-            resource_type="auto",
-            overwrite=True
-        )
+        if isinstance(file, bytes):
+            size = len(file)
+            file = io.BytesIO(file)
+        elif os.path.isfile(file):
+            size = os.path.getsize(file)
+        else:
+            size = 0
+        if size > LARGE_UPLOAD_THRESHOLD_BYTES:
+            upload_result = cloudinary.uploader.upload_large(
+                file,
+                public_id=public_id,
+                resource_type="auto",
+                overwrite=True,
+                chunk_size=LARGE_UPLOAD_CHUNK_BYTES
+            )
+        else:
+            upload_result = cloudinary.uploader.upload(
+                file,
+                public_id=public_id,
+                resource_type="auto",
+                overwrite=True
+            )
         print(f"✅ File successfully uploaded to Cloudinary.")
         return upload_result.get('secure_url')
     except Exception as e:
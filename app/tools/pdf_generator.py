@@ -1,14 +1,26 @@
 # In app/tools/pdf_generator.py
 from weasyprint import HTML, CSS
 
-def create_pdf(html_content: str, css_content: str, pdf_path: str) -> bool:
-    """Renders HTML and CSS content into a PDF file using WeasyPrint."""
+def create_pdf_bytes(html_content: str, css_content: str) -> bytes | None:
+    """Renders HTML and CSS content into PDF bytes without touching disk."""
     try:
         css = CSS(string=css_content)
         html = HTML(string=html_content, base_url='.')
-        html.write_pdf(pdf_path, stylesheets=[css])
-        print(f"✅ PDF successfully generated at: {pdf_path}")
-        return True
+        return html.write_pdf(stylesheets=[css])
     except Exception as e:
         print(f"❌ Error during PDF generation: {e}")
+        return None
+
+def create_pdf(html_content: str, css_content: str, pdf_path: str) -> bool:
+    """Renders HTML and CSS content into a PDF file using WeasyPrint."""
+    pdf_bytes = create_pdf_bytes(html_content, css_content)
+    if pdf_bytes is None:
+        return False
+    try:
+        with open(pdf_path, "wb") as f:
+            f.write(pdf_bytes)
+        print(f"✅ PDF successfully generated at: {pdf_path}")
+        return True
+    except OSError as e:
+        print(f"❌ Error saving PDF to {pdf_path}: {e}")
         return False
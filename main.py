@@ -1,7 +1,8 @@
 from fastapi import FastAPI
 from app.api.v1.endpoints import resumes
+from app.schemas.responses import ORJSONResponse
 
-app = FastAPI(title="Minimal FastAPI App", version="0.1.0")
+app = FastAPI(title="Minimal FastAPI App", version="0.1.0", default_response_class=ORJSONResponse)
 
 app.include_router(resumes.router, prefix="/api/v1/resumes", tags=["resumes"])
 
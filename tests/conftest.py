@@ -0,0 +1,95 @@
+"""Shared fixtures: an in-memory SQLite database wired into the app via
+dependency overrides, so endpoint tests never touch DATABASE_URL."""
+from datetime import datetime
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from main import app
+from app.db.session import Base, get_db, get_read_engine
+from app.models.resume import Resume
+from app.api.v1.endpoints import resumes
+from app.services import resume_service
+
+engine = create_engine(
+    "sqlite://",
+    connect_args={"check_same_thread": False},
+    poolclass=StaticPool,
+)
+TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+
+def override_get_db():
+    db = TestingSessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+def override_get_read_engine():
+    return engine
+
+
+@pytest.fixture()
+def client(monkeypatch):
+    Base.metadata.create_all(bind=engine)
+    db = TestingSessionLocal()
+    db.add_all([
+        Resume(
+            id="r1",
+            userId="u1",
+            name="First",
+            summary=None,
+            personalInfo={"firstName": "Ada"},
+            experience=[{"company": "Acme"}],
+            education={"institution": "MIT"},
+            skills={"languages": ["Python", "Go"]},
+            projects=[{"title": "Engine"}],
+            jobDescription={"title": "Engineer", "skills": ["Python"]},
+            createdAt=datetime(2024, 1, 1, 12, 0, 0),
+            updatedAt=datetime(2024, 1, 2, 12, 0, 0),
+        ),
+        Resume(
+            id="r2",
+            userId="u1",
+            name="Second",
+            summary="Hello",
+            personalInfo=None,
+            experience=None,
+            education=None,
+            skills=["SQL"],
+            projects=None,
+            createdAt=datetime(2024, 2, 1, 12, 0, 0),
+            updatedAt=datetime(2024, 2, 2, 12, 0, 0),
+        ),
+    ])
+    db.commit()
+    db.close()
+
+    resumes._list_cache.clear()
+    resume_service._resume_cache.clear()
+    # Service-level reads open their own connections instead of taking one
+    # from a dependency.
+    monkeypatch.setattr(resume_service, "read_engine", engine)
+    monkeypatch.setattr(resume_service, "engine", engine)
+    app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_engine] = override_get_read_engine
+    try:
+        yield TestClient(app)
+    finally:
+        app.dependency_overrides.clear()
+        Base.metadata.drop_all(bind=engine)
+
+
+@pytest.fixture()
+def db_engine():
+    return engine
+
+
+@pytest.fixture()
+def db_session_factory():
+    return TestingSessionLocal
@@ -0,0 +1,27 @@
+from app.core.cache import LRUCache
+
+
+def test_lru_cache_evicts_least_recently_used():
+    cache = LRUCache(maxsize=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+    assert cache.get("b") is None
+    assert (cache.get("a"), cache.get("c")) == (1, 3)
+
+
+def test_lru_cache_caps_total_weight():
+    cache = LRUCache(maxsize=10, maxweight=10)
+    cache.set("a", "x", weight=4)
+    cache.set("b", "y", weight=4)
+    cache.set("a", "x2", weight=5)
+    assert cache.weight == 9
+    cache.set("c", "z", weight=4)
+    assert cache.get("b") is None
+    assert cache.weight == 9
+
+    # Anything heavier than the cap is never stored.
+    cache.set("big", "w", weight=11)
+    assert cache.get("big") is None
+    assert len(cache) == 2 and cache.weight == 9
@@ -0,0 +1,59 @@
+import importlib
+import sys
+import types
+
+import pytest
+
+
+@pytest.fixture()
+def uploader(monkeypatch):
+    """app.tools.file_uploader imported against a stub cloudinary package."""
+    calls = []
+
+    def record(name):
+        def call(file, **kwargs):
+            calls.append((name, file, kwargs))
+            return {"secure_url": f"https://cdn.example/{kwargs['public_id']}"}
+        return call
+
+    cloudinary = types.ModuleType("cloudinary")
+    cloudinary.config = lambda **kwargs: None
+    cloudinary.uploader = types.ModuleType("cloudinary.uploader")
+    cloudinary.uploader.upload = record("upload")
+    cloudinary.uploader.upload_large = record("upload_large")
+    monkeypatch.setitem(sys.modules, "cloudinary", cloudinary)
+    monkeypatch.setitem(sys.modules, "cloudinary.uploader", cloudinary.uploader)
+    monkeypatch.delitem(sys.modules, "app.tools.file_uploader", raising=False)
+
+    module = importlib.import_module("app.tools.file_uploader")
+    monkeypatch.setattr(module, "LARGE_UPLOAD_THRESHOLD_BYTES", 10)
+    yield module, calls
+    sys.modules.pop("app.tools.file_uploader", None)
+
+
+def test_upload_picks_chunked_upload_by_local_file_size(uploader, tmp_path):
+    module, calls = uploader
+    small = tmp_path / "small.pdf"
+    small.write_bytes(b"x" * 10)
+    large = tmp_path / "large.pdf"
+    large.write_bytes(b"x" * 11)
+
+    assert module.upload_to_cloudinary(str(small), "small") == "https://cdn.example/small"
+    assert module.upload_to_cloudinary(str(large), "large") == "https://cdn.example/large"
+    assert [(name, file) for name, file, _ in calls] == [("upload", str(small)), ("upload_large", str(large))]
+    assert calls[1][2]["chunk_size"] == module.LARGE_UPLOAD_CHUNK_BYTES
+
+
+def test_upload_passes_remote_urls_through(uploader):
+    module, calls = uploader
+    for source in ("https://example.com/resume.pdf", "data:application/pdf;base64,JVBERi0="):
+        assert module.upload_to_cloudinary(source, "remote") == "https://cdn.example/remote"
+    assert [name for name, _, _ in calls] == ["upload", "upload"]
+
+
+def test_upload_sizes_bytes_in_memory(uploader):
+    module, calls = uploader
+    module.upload_to_cloudinary(b"x" * 5, "small")
+    module.upload_to_cloudinary(b"x" * 11, "large")
+    assert [name for name, _, _ in calls] == ["upload", "upload_large"]
+    assert calls[1][1].read() == b"x" * 11
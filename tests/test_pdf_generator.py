@@ -0,0 +1,63 @@
+import importlib
+import sys
+import types
+
+import pytest
+
+
+@pytest.fixture()
+def pdf_generator(monkeypatch):
+    """app.tools.pdf_generator imported against a stub weasyprint package."""
+    renders = []
+
+    class CSS:
+        def __init__(self, string):
+            self.string = string
+
+    class HTML:
+        def __init__(self, string, base_url):
+            if "<broken" in string:
+                raise ValueError("unparseable HTML")
+            self.string = string
+
+        def write_pdf(self, target=None, stylesheets=()):
+            renders.append((self.string, [s.string for s in stylesheets]))
+            return b"%PDF-" + self.string.encode()
+
+    weasyprint = types.ModuleType("weasyprint")
+    weasyprint.HTML = HTML
+    weasyprint.CSS = CSS
+    monkeypatch.setitem(sys.modules, "weasyprint", weasyprint)
+    monkeypatch.delitem(sys.modules, "app.tools.pdf_generator", raising=False)
+
+    yield importlib.import_module("app.tools.pdf_generator"), renders
+    sys.modules.pop("app.tools.pdf_generator", None)
+
+
+def test_create_pdf_bytes_returns_rendered_pdf(pdf_generator):
+    module, renders = pdf_generator
+    assert module.create_pdf_bytes("<p>Hi</p>", "p{}") == b"%PDF-<p>Hi</p>"
+    assert renders == [("<p>Hi</p>", ["p{}"])]
+
+
+def test_create_pdf_bytes_returns_none_on_failure(pdf_generator):
+    module, _ = pdf_generator
+    assert module.create_pdf_bytes("<broken", "") is None
+
+
+def test_create_pdf_writes_the_same_bytes(pdf_generator, tmp_path):
+    module, _ = pdf_generator
+    out = tmp_path / "resume.pdf"
+    assert module.create_pdf("<p>Hi</p>", "p{}", str(out)) is True
+    assert out.read_bytes() == module.create_pdf_bytes("<p>Hi</p>", "p{}")
+    assert module.create_pdf("<broken", "", str(tmp_path / "bad.pdf")) is False
+    assert not (tmp_path / "bad.pdf").exists()
+
+
+def test_create_pdf_reports_save_failures(pdf_generator, tmp_path, capsys):
+    module, _ = pdf_generator
+    target = tmp_path / "missing-dir" / "resume.pdf"
+    assert module.create_pdf("<p>Hi</p>", "p{}", str(target)) is False
+    out = capsys.readouterr().out
+    assert f"Error saving PDF to {target}" in out
+    assert "Error during PDF generation" not in out
@@ -0,0 +1,27 @@
+from datetime import datetime
+from decimal import Decimal
+
+from pydantic import BaseModel
+
+from app.schemas.responses import ORJSONResponse, dumps
+
+
+class Item(BaseModel):
+    name: str
+
+
+def test_dumps_handles_types_orjson_lacks():
+    body = dumps({"price": Decimal("1.50"), "item": Item(name="x"), 1: "non-str key"})
+    assert body == b'{"price":"1.50","item":{"name":"x"},"1":"non-str key"}'
+
+
+def test_orjson_response_renders_datetimes():
+    r = ORJSONResponse({"at": datetime(2024, 1, 1, 12, 0, 0)})
+    assert r.media_type == "application/json"
+    assert r.body == b'{"at":"2024-01-01T12:00:00Z"}'
+
+
+def test_openapi_documents_envelopes(client):
+    paths = client.get("/openapi.json").json()["paths"]
+    ok = paths["/api/v1/resumes/{resume_id}"]["get"]["responses"]["200"]
+    assert ok["content"]["application/json"]["schema"]["$ref"].endswith("/ResumeSingleResponse")
@@ -0,0 +1,46 @@
+import copy
+
+from app.services.resume_normalization import (
+    ensure_list_of_dicts,
+    ensure_list_of_dicts_batch,
+    normalize_personal_info,
+    normalize_personal_info_batch,
+    normalize_projects,
+    normalize_projects_batch,
+    normalize_skills,
+    normalize_skills_batch,
+)
+
+LIST_SHAPES = [None, {"a": 1}, [{"a": 1}, {"b": 2}], ["x", {"a": 1}], "plain", 3, []]
+SKILL_SHAPES = LIST_SHAPES + [{"langs": ["Python", {"name": "Go"}], "misc": "SQL"}]
+PROJECT_SHAPES = LIST_SHAPES + [[{"title": "T"}, {"name": "N", "title": "T"}]]
+PERSONAL_INFO_SHAPES = [None, {}, {"id": "p1"}, {"id": None, "firstName": "A"}, {"firstName": "B"}, "Ada"]
+
+
+def _check(batch_fn, scalar_fn, shapes):
+    expected = [scalar_fn(copy.deepcopy(v)) for v in shapes]
+    assert batch_fn(copy.deepcopy(shapes)) == expected
+
+
+def test_ensure_list_of_dicts_batch_matches_scalar():
+    _check(ensure_list_of_dicts_batch, ensure_list_of_dicts, LIST_SHAPES)
+
+
+def test_normalize_skills_batch_matches_scalar():
+    _check(normalize_skills_batch, normalize_skills, SKILL_SHAPES)
+
+
+def test_normalize_projects_batch_matches_scalar():
+    _check(normalize_projects_batch, normalize_projects, PROJECT_SHAPES)
+
+
+def test_normalize_personal_info_batch_matches_scalar():
+    _check(normalize_personal_info_batch, normalize_personal_info, PERSONAL_INFO_SHAPES)
+
+
+def test_normalize_skills_keeps_category_when_flattening():
+    assert normalize_skills({"langs": ["Python", {"name": "Go", "level": 3}], "misc": "SQL"}) == [
+        {"name": "Python", "category": "langs"},
+        {"category": "langs", "name": "Go", "level": 3},
+        {"name": "SQL", "category": "misc"},
+    ]
@@ -0,0 +1,46 @@
+from datetime import datetime
+
+import pytest
+from pydantic import ValidationError
+
+from app.models.resume import Resume
+from app.schemas.ResumeSchemas import ResumeResponse
+from app.services import resume_service
+
+
+def test_get_resume_pydantic_caches_until_updated(client, db_session_factory):
+    first = resume_service.get_resume_pydantic("r1")
+    assert first.id == "r1"
+    assert resume_service.get_resume_pydantic("r1") is first
+
+    db = db_session_factory()
+    row = db.get(Resume, "r1")
+    row.name = "Renamed"
+    row.updatedAt = datetime(2024, 3, 1, 12, 0, 0)
+    db.commit()
+    db.close()
+
+    refreshed = resume_service.get_resume_pydantic("r1")
+    assert refreshed is not first
+    assert refreshed.name == "Renamed"
+
+
+def test_cached_resume_is_frozen(client):
+    resume = resume_service.get_resume_pydantic("r1")
+    with pytest.raises(ValidationError):
+        resume.name = "Mutated"
+    assert resume_service.get_resume_pydantic("r1").name == "First"
+
+
+def test_get_resume_pydantic_missing(client):
+    assert resume_service.get_resume_pydantic("missing") is None
+
+
+def test_resume_to_pydantic_matches_validated_model(client, db_session_factory):
+    db = db_session_factory()
+    for resume_id in ("r1", "r2"):
+        row = db.get(Resume, resume_id)
+        built = resume_service.resume_to_pydantic(row)
+        validated = ResumeResponse.model_validate(resume_service.model_to_normalized_dict(row))
+        assert built.model_dump() == validated.model_dump()
+    db.close()
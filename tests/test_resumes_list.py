@@ -0,0 +1,186 @@
+from datetime import datetime
+
+from sqlalchemy import event
+
+from main import app
+from app.db.session import get_read_engine
+from app.models.resume import Resume
+from app.api.v1.endpoints import resumes
+from app.crud import crud_resume
+from app.services import resume_service
+
+
+def test_read_resumes_returns_normalized_rows(client):
+    r = client.get("/api/v1/resumes/")
+    assert r.status_code == 200
+    body = r.json()
+    assert body["status"] == 200
+    assert body["message"] == "Resumes returned successfully"
+
+    rows = {row["id"]: row for row in body["data"]}
+    assert set(rows) == {"r1", "r2"}
+
+    first = rows["r1"]
+    assert first["summary"] == ""
+    assert first["personalInfo"] == {"firstName": "Ada", "id": ""}
+    assert first["education"] == [{"institution": "MIT"}]
+    assert first["skills"] == [
+        {"name": "Python", "category": "languages"},
+        {"name": "Go", "category": "languages"},
+    ]
+    assert first["projects"] == [{"title": "Engine", "name": "Engine"}]
+    assert first["createdAt"] == "2024-01-01T12:00:00Z"
+    assert first["jobDescription"] == {"title": "Engineer", "skills": ["Python"]}
+
+    second = rows["r2"]
+    assert second["personalInfo"] == {}
+    assert second["experience"] == []
+    assert second["skills"] == [{"name": "SQL"}]
+    assert second["jobDescription"] is None
+
+
+def test_read_resumes_pagination(client):
+    r = client.get("/api/v1/resumes/", params={"skip": 0, "limit": 1})
+    assert r.status_code == 200
+    assert [row["id"] for row in r.json()["data"]] == ["r2"]
+
+    # Newest updatedAt first, so the next page continues with the older row.
+    r = client.get("/api/v1/resumes/", params={"skip": 1, "limit": 1})
+    assert [row["id"] for row in r.json()["data"]] == ["r1"]
+
+
+def test_read_resumes_rejects_negative_paging(client):
+    # A negative limit would otherwise dodge the streaming threshold (and
+    # mean "no limit" on SQLite / raise on Postgres).
+    for params in ({"limit": -1}, {"skip": -1}):
+        assert client.get("/api/v1/resumes/", params=params).status_code == 422
+    assert len(resumes._list_cache) == 0
+
+
+def test_read_resumes_etag_roundtrip(client):
+    first = client.get("/api/v1/resumes/")
+    etag = first.headers["etag"]
+    assert etag
+
+    cached = client.get("/api/v1/resumes/", headers={"If-None-Match": etag})
+    assert cached.status_code == 304
+    assert cached.headers["etag"] == etag
+
+
+def test_read_resumes_etag_weak_and_list_forms(client):
+    etag = client.get("/api/v1/resumes/").headers["etag"]
+
+    for header in (f"W/{etag}", f'"other", {etag}', f'W/"other" , W/{etag}', "*"):
+        r = client.get("/api/v1/resumes/", headers={"If-None-Match": header})
+        assert r.status_code == 304, header
+
+    assert client.get("/api/v1/resumes/", headers={"If-None-Match": '"other", W/"nope"'}).status_code == 200
+
+
+def test_read_resumes_cache_invalidated_on_update(client, db_session_factory):
+    etag = client.get("/api/v1/resumes/").headers["etag"]
+
+    db = db_session_factory()
+    row = db.get(Resume, "r2")
+    row.name = "Renamed"
+    row.updatedAt = datetime(2024, 3, 1, 12, 0, 0)
+    db.commit()
+    db.close()
+
+    r = client.get("/api/v1/resumes/", headers={"If-None-Match": etag})
+    assert r.status_code == 200
+    assert r.headers["etag"] != etag
+    assert {row["name"] for row in r.json()["data"]} == {"First", "Renamed"}
+
+
+def test_read_resumes_streams_large_pages(client, db_engine, monkeypatch):
+    buffered = client.get("/api/v1/resumes/").json()
+
+    # Streamed pages must run in a transaction (server-side cursors need one)
+    # and must not also hold a read connection from the dependency.
+    monkeypatch.setattr(resume_service, "read_engine", db_engine.execution_options(isolation_level="AUTOCOMMIT"))
+
+    class NoConnect:
+        def connect(self):
+            raise AssertionError("streamed list should not check out a read connection")
+
+    monkeypatch.setitem(app.dependency_overrides, get_read_engine, NoConnect)
+    options = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        options.append(dict(context.execution_options))
+
+    event.listen(db_engine, "before_cursor_execute", capture)
+    try:
+        r = client.get("/api/v1/resumes/", params={"limit": resumes.STREAM_LIST_THRESHOLD + 1})
+    finally:
+        event.remove(db_engine, "before_cursor_execute", capture)
+
+    assert r.status_code == 200
+    assert "etag" not in r.headers
+    assert r.json() == buffered
+    assert options and all(o.get("isolation_level") != "AUTOCOMMIT" for o in options)
+
+
+def test_read_routes_follow_read_engine_override(client, db_engine):
+    # Every read route connects through get_read_engine, so one override
+    # repoints them all.
+    connects = []
+
+    class CountingEngine:
+        def connect(self):
+            connects.append(True)
+            return db_engine.connect()
+
+    app.dependency_overrides[get_read_engine] = CountingEngine
+    assert client.get("/api/v1/resumes/").status_code == 200
+    assert client.get("/api/v1/resumes/r1").status_code == 200
+    assert len(connects) == 2
+
+
+def test_read_resume_single(client):
+    r = client.get("/api/v1/resumes/r1")
+    assert r.status_code == 200
+    data = r.json()["data"]
+    assert data["id"] == "r1"
+    assert data["skills"] == [
+        {"name": "Python", "category": "languages"},
+        {"name": "Go", "category": "languages"},
+    ]
+
+    missing = client.get("/api/v1/resumes/nope")
+    assert missing.json() == {"status": 404, "message": "Resume not found", "data": None}
+
+
+def test_read_resumes_cache_sees_deletes_after_ttl(client, db_session_factory, monkeypatch):
+    bucket = [0]
+    monkeypatch.setattr(resumes, "_list_cache_bucket", lambda: bucket[0])
+    assert {row["id"] for row in client.get("/api/v1/resumes/").json()["data"]} == {"r1", "r2"}
+
+    # Deleting an older row leaves max(updatedAt) unchanged...
+    db = db_session_factory()
+    db.delete(db.get(Resume, "r1"))
+    db.commit()
+    db.close()
+    assert {row["id"] for row in client.get("/api/v1/resumes/").json()["data"]} == {"r1", "r2"}
+
+    # ...so it shows up once the TTL bucket rolls over.
+    bucket[0] += 1
+    assert [row["id"] for row in client.get("/api/v1/resumes/").json()["data"]] == ["r2"]
+
+
+def test_iter_resumes_requests_server_side_cursor(client, db_engine):
+    options = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        options.append(dict(context.execution_options))
+
+    event.listen(db_engine, "before_cursor_execute", capture)
+    try:
+        with db_engine.connect() as conn:
+            batches = list(crud_resume.iter_resumes(conn, limit=10, batch_size=1))
+    finally:
+        event.remove(db_engine, "before_cursor_execute", capture)
+
+    assert [[row.id for row in batch] for batch in batches] == [["r2"], ["r1"]]
+    assert options == [{"yield_per": 1, "stream_results": True, "max_row_buffer": 1}]
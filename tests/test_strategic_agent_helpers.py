@@ -0,0 +1,132 @@
+import asyncio
+
+import pytest
+
+from app.agents.resume.strategic import strategic_resume_agent as agent
+
+
+class RecordingCollection:
+    def __init__(self):
+        self.calls = []
+
+    def add(self, documents, metadatas, ids):
+        self.calls.append((documents, metadatas, ids))
+
+
+def test_add_in_batches_splits_large_adds(monkeypatch):
+    monkeypatch.setattr(agent, "CHROMA_ADD_BATCH_SIZE", 2)
+    collection = RecordingCollection()
+    docs = ["a", "b", "c", "d", "e"]
+
+    agent.add_in_batches(collection, docs, [{"i": i} for i in range(5)], [str(i) for i in range(5)])
+
+    assert [c[0] for c in collection.calls] == [["a", "b"], ["c", "d"], ["e"]]
+    assert collection.calls[-1][1] == [{"i": 4}]
+    assert collection.calls[-1][2] == ["4"]
+
+
+def test_embed_queries_caches_and_batches_misses(monkeypatch):
+    calls = []
+
+    def fake_embed(texts):
+        calls.append(list(texts))
+        return [[float(len(t))] for t in texts]
+
+    monkeypatch.setattr(agent, "EMBEDDING_FUNCTION", fake_embed)
+    monkeypatch.setattr(agent, "_query_embedding_cache", agent.LRUCache(maxsize=8))
+
+    assert agent.embed_queries(["go", "rust", "go"]) == [[2.0], [4.0], [2.0]]
+    assert agent.embed_queries(["rust", "python"]) == [[4.0], [6.0]]
+    assert calls == [["go", "rust"], ["python"]]
+
+
+def test_process_resumes_for_chroma_shapes():
+    resume = {
+        "summary": "Builder",
+        "experience": [
+            {"company": "Acme", "position": "Eng", "responsibilities": ["did X", "", "did Y"]},
+            {"company": None, "responsibilities": "line 1\n\n  line 2  \n"},
+            {"company": "Empty", "responsibilities": []},
+        ],
+        "projects": [{"id": "p1", "name": "Proj", "description": "desc"}, {"name": "", "description": ""}],
+        "skills": [{"name": "Python"}, {"name": ""}, {"name": "Go"}],
+        "education": [{"id": "e1", "institution": "MIT", "degree": "BSc"}, {"institution": "", "degree": ""}],
+        "personalInfo": {"email": "a@b.c", "github": "ada"},
+    }
+
+    documents, metadatas, ids = agent.process_resumes_for_chroma(resume)
+
+    assert documents == [
+        "did X",
+        "did Y",
+        "line 1",
+        "line 2",
+        "Proj: desc",
+        "Key technical skills include: Python, Go",
+        "Builder",
+        "BSc from MIT",
+        "Contact information: Email: a@b.c, GitHub: ada",
+    ]
+    assert metadatas[0] == {
+        "type": "experience",
+        "company": "Acme",
+        "position": "Eng",
+        "startDate": "Unknown",
+        "endDate": "Unknown",
+    }
+    assert metadatas[2]["company"] == "Unknown Company"
+    assert [m["type"] for m in metadatas[4:]] == [
+        "project", "skills_summary", "summary", "education", "contact_info"
+    ]
+    assert ids[4:] == ["p1", "skills_summary_01", "main_summary_01", "e1", "contact_info_01"]
+    assert len(set(ids[:4])) == 4
+
+
+def test_strategic_stream_drops_its_collections(monkeypatch):
+    seen = []
+
+    async def fake_workflow(resume_id, job_description_url, resume, resume_name, jd_name):
+        agent.CHROMA_CLIENT.get_or_create_collection(name=resume_name)
+        seen.extend([resume_name, jd_name])
+        raise ValueError("boom")
+        yield
+
+    monkeypatch.setattr(agent, "_run_strategic_workflow", fake_workflow)
+
+    async def run():
+        async for _ in agent.strategic_resume_agent_stream("r1", "https://example.com/job"):
+            pass
+
+    with pytest.raises(ValueError):
+        asyncio.run(run())
+
+    assert seen[0] != seen[1]
+    names = {c.name for c in agent.CHROMA_CLIENT.list_collections()}
+    assert not names & set(seen)
+
+
+def test_query_collection_flattens_and_dedupes(monkeypatch):
+    monkeypatch.setattr(agent, "embed_queries", lambda queries: [[0.0] for _ in queries])
+
+    class FakeCollection:
+        def query(self, query_embeddings, n_results):
+            assert len(query_embeddings) == 2
+            return {
+                "documents": [["a", "b"], ["b", "c"]],
+                "metadatas": [[{"k": "a"}, {"k": "b1"}], [{"k": "b2"}, {"k": "c"}]],
+                "distances": [[0.5, 0.4], [0.1, 0.9]],
+            }
+
+    parts = agent.query_collection(FakeCollection(), ["q1", "q2"], top_k=2)
+
+    assert parts == [
+        {"document": "b", "metadata": {"k": "b2"}, "score": 0.1},
+        {"document": "a", "metadata": {"k": "a"}, "score": 0.5},
+        {"document": "c", "metadata": {"k": "c"}, "score": 0.9},
+    ]
+    assert agent.query_collection(FakeCollection(), [], top_k=2) == []
+
+
+def test_dedupe_chunks_keeps_first_occurrence():
+    chunks = ["Apply now", "Python  and Go", "", "apply NOW ", "  ", "python and go", "Remote"]
+    assert agent.dedupe_chunks(chunks) == ["Apply now", "Python  and Go", "Remote"]
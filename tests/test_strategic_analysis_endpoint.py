@@ -0,0 +1,202 @@
+import asyncio
+import json
+
+import httpx
+
+from main import app
+from app.api.v1.endpoints import resumes
+from app.schemas.ResumeSchemas import ResumeResponse
+
+
+def test_strategic_analysis_passes_loaded_resume_to_agent(client, monkeypatch):
+    calls = []
+
+    async def fake_agent(**kwargs):
+        calls.append(kwargs)
+        return {"summary": "ok"}
+
+    monkeypatch.setattr(resumes, "strategic_resume_agent", fake_agent)
+
+    r = client.post(
+        "/api/v1/resumes/strategic-analysis",
+        data={"resume_id": "r1", "job_description_url": "https://example.com/job"},
+    )
+    assert r.status_code == 200
+    assert r.json()["data"] == {"summary": "ok"}
+
+    assert len(calls) == 1
+    resume = calls[0]["resume"]
+    assert isinstance(resume, ResumeResponse)
+    assert resume.id == "r1"
+
+
+def test_strategic_analysis_unknown_resume(client, monkeypatch):
+    async def fake_agent(**kwargs):
+        raise AssertionError("agent should not run for a missing resume")
+
+    monkeypatch.setattr(resumes, "strategic_resume_agent", fake_agent)
+
+    r = client.post(
+        "/api/v1/resumes/strategic-analysis",
+        data={"resume_id": "missing", "job_description_url": "https://example.com/job"},
+    )
+    assert r.status_code == 404
+    assert r.json()["detail"] == "Resume not found"
+
+
+def test_strategic_analysis_times_out_and_cancels_agent(client, monkeypatch):
+    cancelled = []
+
+    async def slow_agent(**kwargs):
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.append(True)
+            raise
+
+    monkeypatch.setattr(resumes, "strategic_resume_agent", slow_agent)
+    monkeypatch.setattr(resumes, "AGENT_TIMEOUT", 0.05)
+
+    r = client.post(
+        "/api/v1/resumes/strategic-analysis",
+        data={"resume_id": "r1", "job_description_url": "https://example.com/job"},
+    )
+    assert r.status_code == 504
+    assert cancelled == [True]
+
+
+def test_strategic_analysis_queue_wait_counts_against_timeout(client, monkeypatch):
+    # One slot, held by an agent that is slow to give it back even once
+    # cancelled; the queued request must still time out on schedule.
+    monkeypatch.setattr(resumes, "LLM_SEM", asyncio.Semaphore(1))
+    monkeypatch.setattr(resumes, "AGENT_TIMEOUT", 0.1)
+    started = []
+
+    async def scenario():
+        release = asyncio.Event()
+        holding = asyncio.Event()
+
+        async def agent(**kwargs):
+            started.append(kwargs["resume_id"])
+            holding.set()
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                await release.wait()
+                raise
+
+        monkeypatch.setattr(resumes, "strategic_resume_agent", agent)
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as ac:
+            def post():
+                return ac.post(
+                    "/api/v1/resumes/strategic-analysis",
+                    data={"resume_id": "r1", "job_description_url": "https://example.com/job"},
+                )
+
+            first = asyncio.ensure_future(post())
+            await holding.wait()
+            second = await asyncio.wait_for(post(), timeout=5)
+            release.set()
+            return (await first).status_code, second.status_code
+
+    assert asyncio.run(scenario()) == (504, 504)
+    assert started == ["r1"]
+
+
+def test_strategic_analysis_stream_queue_wait_counts_against_timeout(client, monkeypatch):
+    async def fake_stream(**kwargs):
+        raise AssertionError("agent should not start without a free slot")
+        yield
+
+    monkeypatch.setattr(resumes, "strategic_resume_agent_stream", fake_stream)
+    # No free slots at all.
+    monkeypatch.setattr(resumes, "LLM_SEM", asyncio.Semaphore(0))
+    monkeypatch.setattr(resumes, "AGENT_TIMEOUT", 0.05)
+
+    r = client.post(
+        "/api/v1/resumes/strategic-analysis/stream",
+        data={"resume_id": "r1", "job_description_url": "https://example.com/job"},
+    )
+    assert r.text.startswith("event: error\n")
+    assert '"status":504' in r.text
+
+
+def test_strategic_analysis_stream_emits_sse_events(client, monkeypatch):
+    async def fake_stream(**kwargs):
+        assert isinstance(kwargs["resume"], ResumeResponse)
+        yield {"step": "fragment", "key": "summary", "delta": "Hi"}
+        yield {"step": "done", "data": {"summary": "Hi"}}
+
+    monkeypatch.setattr(resumes, "strategic_resume_agent_stream", fake_stream)
+
+    r = client.post(
+        "/api/v1/resumes/strategic-analysis/stream",
+        data={"resume_id": "r1", "job_description_url": "https://example.com/job"},
+    )
+    assert r.status_code == 200
+    assert r.headers["content-type"].startswith("text/event-stream")
+
+    events = [block.split("\n") for block in r.text.strip().split("\n\n")]
+    assert [e[0] for e in events] == ["event: fragment", "event: done"]
+    assert json.loads(events[-1][1][len("data: "):])["data"] == {"summary": "Hi"}
+
+
+def test_strategic_analysis_stream_reports_agent_errors(client, monkeypatch):
+    async def failing_stream(**kwargs):
+        raise ValueError("No resume data found")
+        yield
+
+    monkeypatch.setattr(resumes, "strategic_resume_agent_stream", failing_stream)
+
+    r = client.post(
+        "/api/v1/resumes/strategic-analysis/stream",
+        data={"resume_id": "r1", "job_description_url": "https://example.com/job"},
+    )
+    assert r.text.startswith("event: error\n")
+    assert '"status":400' in r.text
+
+    missing = client.post(
+        "/api/v1/resumes/strategic-analysis/stream",
+        data={"resume_id": "missing", "job_description_url": "https://example.com/job"},
+    )
+    assert missing.status_code == 404
+
+
+def _consume_slowly(monkeypatch, agent_stream, pause):
+    monkeypatch.setattr(resumes, "strategic_resume_agent_stream", agent_stream)
+    monkeypatch.setattr(resumes, "LLM_SEM", asyncio.Semaphore(1))
+    monkeypatch.setattr(resumes, "AGENT_TIMEOUT", 0.1)
+
+    async def consume():
+        events = []
+        stream = resumes._strategic_event_stream("r1", "https://example.com/job", resume=None)
+        try:
+            async for chunk in stream:
+                events.append(chunk.split(b"\n", 1)[0].decode())
+                # A client that is slow between events, past the deadline.
+                await asyncio.sleep(pause)
+        finally:
+            await stream.aclose()
+        return events
+
+    return asyncio.run(consume())
+
+
+def test_strategic_analysis_stream_survives_slow_consumer(monkeypatch):
+    async def agent_stream(**kwargs):
+        yield {"step": "fragment", "key": "summary", "delta": "Hi"}
+        await asyncio.sleep(10)
+        yield {"step": "done", "data": {}}
+
+    events = _consume_slowly(monkeypatch, agent_stream, pause=0.2)
+    assert events == ["event: fragment", "event: error"]
+
+
+def test_strategic_analysis_stream_delivers_ready_events_to_slow_consumer(monkeypatch):
+    async def agent_stream(**kwargs):
+        yield {"step": "fragment", "key": "summary", "delta": "Hi"}
+        yield {"step": "done", "data": {}}
+
+    events = _consume_slowly(monkeypatch, agent_stream, pause=0.2)
+    assert events == ["event: fragment", "event: done"]
@@ -16,10 +16,10 @@ sys.path.insert(0, '/Users/berato/Sites/rmcraft-backend')
 def test_endpoint_request_structure():
     """Test the endpoint request structure"""
     try:
-        from app.api.v1.endpoints.resume_strategic import StrategicAnalysisRequest
+        from app.api.v1.endpoints.resumes import StrategicResumeRequest
         
         # Test that we can create a request object
-        request = StrategicAnalysisRequest(
+        request = StrategicResumeRequest(
             resume_id="test_resume_id",
             job_description_url="https://example.com/job"
         )